@@ -0,0 +1,67 @@
+/**
+ * Progress Log Inflater
+ *
+ * Converts a binary progress file written by the logger with
+ * enableBinaryProgress (logs/<process>_<timestamp>.progress.bin) into
+ * readable lines of the form "[timestamp] Progress: processed/total (pct%)".
+ * ETA is not recorded in the binary format, so it is not shown.
+ *
+ * Records with an unknown type are skipped and counted.
+ *
+ * Usage: node scripts/inflate_progress_log.js <file.progress.bin>
+ */
+
+const fs = require('fs').promises;
+const Logger = require('../src/utils/logger');
+
+async function inflateProgressLog(filePath) {
+  const data = await fs.readFile(filePath);
+  const recordSize = Logger.PROGRESS_RECORD_SIZE;
+
+  if (data.length % recordSize !== 0) {
+    console.warn(`⚠️  Trailing ${data.length % recordSize} byte(s) ignored (incomplete record)`);
+  }
+
+  const lines = [];
+  let skipped = 0;
+  for (let offset = 0; offset + recordSize <= data.length; offset += recordSize) {
+    const record = Logger.decodeProgressRecord(data, offset);
+    if (record.type !== Logger.PROGRESS_RECORD_TYPE) {
+      skipped++;
+      continue;
+    }
+    const timestamp = new Date(Number(record.timestampNs / 1000000n)).toISOString();
+
+    let progressMessage;
+    if (record.totalItems > 0) {
+      const percentage = Logger.formatPercentage(record.processedItems, record.totalItems);
+      progressMessage = `Progress: ${record.processedItems}/${record.totalItems} (${percentage}%)`;
+    } else {
+      progressMessage = `Processed: ${record.processedItems} items`;
+    }
+
+    lines.push(`[${timestamp}] ${progressMessage}`);
+  }
+
+  if (skipped > 0) {
+    console.warn(`⚠️  Skipped ${skipped} record(s) with an unknown type`);
+  }
+
+  process.stdout.write(lines.length > 0 ? lines.join('\n') + '\n' : '');
+  return lines.length;
+}
+
+if (require.main === module) {
+  const filePath = process.argv[2];
+  if (!filePath) {
+    console.error('Usage: node scripts/inflate_progress_log.js <file.progress.bin>');
+    process.exit(1);
+  }
+
+  inflateProgressLog(filePath).catch((error) => {
+    console.error(`❌ Failed to inflate ${filePath}: ${error.message}`);
+    process.exit(1);
+  });
+}
+
+module.exports = inflateProgressLog;
@@ -21,7 +21,12 @@ const {
 
 class CryptoImporter {
   constructor() {
-    this.logger = new Logger('CCXT Crypto Data Import', DATA_CONFIG.logConfig.logsPath);
+    this.logger = new Logger(
+      'CCXT Crypto Data Import',
+      DATA_CONFIG.logConfig.enableFileLogging,
+      DATA_CONFIG.logConfig.logsPath,
+      DATA_CONFIG.logConfig.logLevel
+    );
     this.csvWriter = new CsvWriter(DATA_CONFIG.dataPaths.crypto);
     this.exchanges = {};
 
@@ -17,7 +17,8 @@ class DukascopyImporter {
     this.logger = new Logger(
       'Dukascopy TradFi Data Import',
       DATA_CONFIG.logConfig.enableFileLogging,
-      DATA_CONFIG.logConfig.logsPath
+      DATA_CONFIG.logConfig.logsPath,
+      DATA_CONFIG.logConfig.logLevel
     );
     this.csvWriter = new CSVWriter(DATA_CONFIG.dataPaths.tradfi);
 
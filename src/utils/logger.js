@@ -4,19 +4,98 @@
  */
 
 const fs = require('fs').promises;
+const { writeSync } = require('fs');
 const path = require('path');
 
+// Console prefixes keyed by (already upper-case) level
+const LEVEL_EMOJI = {
+  'INFO': 'ℹ️ ',
+  'SUCCESS': '✅',
+  'WARN': '⚠️ ',
+  'ERROR': '❌',
+  'DEBUG': '🔍'
+};
+
+// Pre-encoded console (emoji) and file (plain tag) line prefixes, so the
+// constant part isn't run through the UTF-8 encoder on every event
+const LEVEL_PREFIX_BYTES = Object.fromEntries(
+  Object.entries(LEVEL_EMOJI).map(([level, emoji]) => [level, Buffer.from(`${emoji} `)])
+);
+const LEVEL_TAG_BYTES = Object.fromEntries(
+  Object.keys(LEVEL_EMOJI).map((level) => [level, Buffer.from(`[${level}] `)])
+);
+const NO_PREFIX_BYTES = Buffer.from(' ');
+
+// Severity order used to drop events below the configured log level
+const LOG_LEVELS = {
+  'DEBUG': 10,
+  'INFO': 20,
+  'SUCCESS': 25,
+  'WARN': 30,
+  'ERROR': 40
+};
+
+const SEPARATOR = '─'.repeat(60);
+const HEADER_RULE = '='.repeat(80);
+
+// Queued log data is written early once it grows past this many bytes
+const LOG_BUFFER_LIMIT = 64 * 1024;
+
+// Binary progress records: u8 record type, u64 epoch ns, u32 processed,
+// u32 total (little-endian). See scripts/inflate_progress_log.js
+const PROGRESS_RECORD_TYPE = 1;
+const PROGRESS_RECORD_SIZE = 17;
+const PROGRESS_BUFFER_RECORDS = Math.floor(4096 / PROGRESS_RECORD_SIZE);
+
+// Minimum gap between progress lines that don't land on a progress stride
+const PROGRESS_INTERVAL_MS = 250;
+
+// Loggers with an open log file. Whatever they still hold is written out
+// synchronously if the process exits (e.g. process.exit(1) after an error)
+const openLoggers = new Set();
+
+process.on('exit', () => {
+  for (const logger of openLoggers) {
+    logger.drainSync();
+  }
+});
+
+function writeAllSync(fd, data) {
+  let offset = 0;
+  while (offset < data.length) {
+    offset += writeSync(fd, data, offset);
+  }
+}
+
 class Logger {
-  constructor(processName = 'ETL Process', enableFileLogging = true, logsPath = './logs') {
+  constructor(processName = 'ETL Process', enableFileLogging = true, logsPath = './logs', logLevel = 'INFO', enableBinaryProgress = false) {
     this.processName = processName;
+    this.fileSafeName = processName.toLowerCase().replace(/\s+/g, '_');
     this.startTime = null;
+    this.startNs = null;
     this.totalItems = 0;
     this.processedItems = 0;
+    this.progressStride = 1;
+    this.nextProgressAt = 0;
     this.errors = [];
     this.enableFileLogging = enableFileLogging;
     this.logsPath = logsPath;
+    this.minLevel = LOG_LEVELS[String(logLevel).toUpperCase()] ?? LOG_LEVELS.INFO;
     this.logFile = null;
+    this.logHandle = null;
     this.logBuffer = [];
+    this.logBufferSize = 0;
+    this.pendingWrite = Promise.resolve();
+    // Chunks handed to pendingWrite whose write hasn't started yet
+    this.queuedWrites = [];
+    // Optional compact sink for updateProgress, written next to the log file
+    this.enableBinaryProgress = enableBinaryProgress;
+    this.progressFile = null;
+    this.progressHandle = null;
+    this.progressBuffer = null;
+    this.progressOffset = 0;
+    this.flushScheduled = false;
+    this.timestampCache = { second: -1, prefix: '' };
   }
 
   async initializeLogging() {
@@ -30,51 +109,206 @@ class Logger {
 
       // Create log filename with timestamp
       const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-      const logFileName = `${this.processName.toLowerCase().replace(/\s+/g, '_')}_${timestamp}.log`;
+      const logFileName = `${this.fileSafeName}_${timestamp}.log`;
       this.logFile = path.join(this.logsPath, logFileName);
-      
+
+      // Keep a single append handle open for the whole run instead of
+      // reopening the file on every write
+      await this.closeLogFile();
+      this.logHandle = await fs.open(this.logFile, 'a', 0o644);
+      openLoggers.add(this);
+
+      if (this.enableBinaryProgress) {
+        this.progressFile = this.logFile.replace(/\.log$/, '.progress.bin');
+        this.progressHandle = await fs.open(this.progressFile, 'a', 0o644);
+        this.progressBuffer = Buffer.allocUnsafe(PROGRESS_BUFFER_RECORDS * PROGRESS_RECORD_SIZE);
+        this.progressOffset = 0;
+      }
+
       // Initialize log file with header
-      await this.writeToFile(`=== ${this.processName} Log Started ===`);
-      await this.writeToFile(`Log file: ${this.logFile}`);
-      await this.writeToFile(`Timestamp: ${new Date().toISOString()}`);
-      await this.writeToFile('='.repeat(80));
+      await this.writeLinesToFile([
+        `=== ${this.processName} Log Started ===`,
+        `Log file: ${this.logFile}`,
+        `Timestamp: ${this.formatTimestamp()}`,
+        HEADER_RULE
+      ]);
     }
   }
 
   async writeToFile(message) {
-    if (this.enableFileLogging && this.logFile) {
-      try {
-        await fs.appendFile(this.logFile, message + '\n');
-      } catch (error) {
-        console.error('Failed to write to log file:', error.message);
+    await this.writeLinesToFile([message]);
+  }
+
+  async writeLinesToFile(lines) {
+    this.queueFile([Buffer.from(lines.join('\n') + '\n')]);
+  }
+
+  writeToConsole(lines) {
+    this.queueConsole([Buffer.from(lines.join('\n') + '\n')]);
+  }
+
+  queueFile(chunks) {
+    // Queue the event and let the next event-loop turn drain everything
+    // queued so far in one write, keeping disk I/O off the caller's path
+    if (this.enableFileLogging && this.logHandle) {
+      for (const chunk of chunks) {
+        this.logBuffer.push(chunk);
+        this.logBufferSize += chunk.length;
+      }
+
+      if (this.logBufferSize > LOG_BUFFER_LIMIT) {
+        this.flushLogBuffer();
+      } else {
+        this.scheduleFlush();
+      }
+    }
+  }
+
+  queueConsole(chunks) {
+    // One stdout write per event, issued before the caller continues so
+    // output stays in order with other console.log calls
+    process.stdout.write(chunks.length === 1 ? chunks[0] : Buffer.concat(chunks));
+  }
+
+  scheduleFlush() {
+    if (!this.flushScheduled) {
+      this.flushScheduled = true;
+      setImmediate(() => this.flush());
+    }
+  }
+
+  flush() {
+    this.flushScheduled = false;
+    this.flushLogBuffer();
+    return this.pendingWrite;
+  }
+
+  flushLogBuffer() {
+    if (this.logBuffer.length === 0 || !this.logHandle) return;
+
+    const data = Buffer.concat(this.logBuffer, this.logBufferSize);
+    this.logBuffer = [];
+    this.logBufferSize = 0;
+    this.enqueueWrite(this.logHandle, data, 'Failed to write to log file:');
+  }
+
+  enqueueWrite(handle, data, errorMessage) {
+    // Chain writes so chunks land in order with one write in flight at a time;
+    // appendFile keeps writing until the whole chunk is on disk
+    const entry = { handle, data };
+    this.queuedWrites.push(entry);
+    this.pendingWrite = this.pendingWrite
+      .then(() => {
+        this.queuedWrites.splice(this.queuedWrites.indexOf(entry), 1);
+        return handle.appendFile(data);
+      })
+      .catch((error) => {
+        console.error(errorMessage, error.message);
+      });
+  }
+
+  drainSync() {
+    // Last-chance synchronous write of everything not yet handed to the OS
+    try {
+      for (const { handle, data } of this.queuedWrites) {
+        writeAllSync(handle.fd, data);
+      }
+      this.queuedWrites = [];
+
+      if (this.logHandle && this.logBufferSize > 0) {
+        writeAllSync(this.logHandle.fd, Buffer.concat(this.logBuffer, this.logBufferSize));
+        this.logBuffer = [];
+        this.logBufferSize = 0;
       }
+
+      if (this.progressHandle && this.progressOffset > 0) {
+        writeAllSync(this.progressHandle.fd, this.progressBuffer.subarray(0, this.progressOffset));
+        this.progressOffset = 0;
+      }
+    } catch (error) {
+      console.error('Failed to write to log file:', error.message);
+    }
+  }
+
+  writeProgressRecord(monotonicNs = process.hrtime.bigint()) {
+    const nowNs = BigInt(this.startTime) * 1000000n + (monotonicNs - this.startNs);
+    const buffer = this.progressBuffer;
+    const offset = this.progressOffset;
+
+    buffer.writeUInt8(PROGRESS_RECORD_TYPE, offset);
+    buffer.writeBigUInt64LE(nowNs, offset + 1);
+    buffer.writeUInt32LE(this.processedItems >>> 0, offset + 9);
+    buffer.writeUInt32LE(this.totalItems >>> 0, offset + 13);
+    this.progressOffset = offset + PROGRESS_RECORD_SIZE;
+
+    if (this.progressOffset === buffer.length) {
+      this.flushProgressBuffer();
+    }
+  }
+
+  flushProgressBuffer() {
+    if (this.progressOffset === 0 || !this.progressHandle) return;
+
+    // Hand the filled buffer to the write and start a fresh one
+    const data = this.progressBuffer.subarray(0, this.progressOffset);
+    this.progressBuffer = Buffer.allocUnsafe(this.progressBuffer.length);
+    this.progressOffset = 0;
+    this.enqueueWrite(this.progressHandle, data, 'Failed to write progress records:');
+  }
+
+  static decodeProgressRecord(buffer, offset = 0) {
+    return {
+      type: buffer.readUInt8(offset),
+      timestampNs: buffer.readBigUInt64LE(offset + 1),
+      processedItems: buffer.readUInt32LE(offset + 9),
+      totalItems: buffer.readUInt32LE(offset + 13)
+    };
+  }
+
+  async closeLogFile() {
+    if (!this.logHandle) return;
+
+    this.flushLogBuffer();
+    this.flushProgressBuffer();
+    const handle = this.logHandle;
+    const progressHandle = this.progressHandle;
+    this.logHandle = null;
+    this.progressHandle = null;
+    await this.pendingWrite;
+    openLoggers.delete(this);
+    await handle.close();
+    if (progressHandle) {
+      await progressHandle.close();
     }
   }
 
   async log(level, message, error = null) {
-    const timestamp = new Date().toISOString();
-    const logMessage = `[${timestamp}] [${level.toUpperCase()}] ${message}`;
-    
-    // Console logging with emojis
-    const emoji = {
-      'INFO': 'ℹ️ ',
-      'SUCCESS': '✅',
-      'WARN': '⚠️ ',
-      'ERROR': '❌',
-      'DEBUG': '🔍'
-    }[level.toUpperCase()] || '';
-    
-    console.log(`${emoji} [${timestamp}] ${message}`);
-    
-    // File logging (plain text, no emojis)
-    await this.writeToFile(logMessage);
+    // Filter before any timestamp or string formatting work
+    if (LOG_LEVELS[level] < this.minLevel) return;
+
+    const timestamp = this.formatTimestamp();
+    // Console and file lines share one formatted, encoded body; only the
+    // prefix differs (emoji on the console, plain level tag in the file)
+    const body = Buffer.from(`[${timestamp}] ${message}\n`);
+    const consoleChunks = [LEVEL_PREFIX_BYTES[level] ?? NO_PREFIX_BYTES, body];
+    const fileChunks = [LEVEL_TAG_BYTES[level] ?? Buffer.from(`[${level}] `), body];
     
     if (error) {
-      const errorDetails = `   Error details: ${error.message}`;
-      console.log(errorDetails);
-      await this.writeToFile(`   Error details: ${error.message}`);
-      await this.writeToFile(`   Stack trace: ${error.stack}`);
-      this.errors.push({ message, error: error.message, timestamp });
+      const errorMessage = error.message ?? String(error);
+      const errorDetails = Buffer.from(`   Error details: ${errorMessage}\n`);
+      consoleChunks.push(errorDetails);
+      fileChunks.push(errorDetails, Buffer.from(`   Stack trace: ${error.stack ?? String(error)}\n`));
+      // [message, error message, timestamp]
+      this.errors.push([message, errorMessage, timestamp]);
+    }
+
+    this.queueConsole(consoleChunks);
+    this.queueFile(fileChunks);
+
+    // Errors are on disk by the time the call resolves, as callers often
+    // exit right after logging one
+    if (level === 'ERROR') {
+      await this.flush();
     }
   }
 
@@ -82,27 +316,29 @@ class Logger {
     await this.initializeLogging();
     
     this.startTime = Date.now();
+    this.startNs = process.hrtime.bigint();
     this.totalItems = totalItems;
     this.processedItems = 0;
+    this.progressStride = Math.max(1, Math.floor(totalItems / 1000));
+    this.nextProgressAt = 0;
     this.errors = [];
     
     const startMessage = `Starting ${this.processName}`;
-    const timeMessage = `Start time: ${new Date(this.startTime).toISOString()}`;
-    const separator = '─'.repeat(60);
+    const timeMessage = `Start time: ${this.formatTimestamp(this.startTime)}`;
     
-    console.log(`\n🚀 ${startMessage}`);
-    console.log(`📅 ${timeMessage}`);
+    const consoleLines = [`\n🚀 ${startMessage}`, `📅 ${timeMessage}`];
     if (totalItems > 0) {
-      console.log(`📊 Total items to process: ${totalItems}`);
+      consoleLines.push(`📊 Total items to process: ${totalItems}`);
     }
-    console.log(separator);
+    consoleLines.push(SEPARATOR);
+    this.writeToConsole(consoleLines);
 
-    await this.writeToFile(`\n${startMessage}`);
-    await this.writeToFile(timeMessage);
+    const lines = [`\n${startMessage}`, timeMessage];
     if (totalItems > 0) {
-      await this.writeToFile(`Total items to process: ${totalItems}`);
+      lines.push(`Total items to process: ${totalItems}`);
     }
-    await this.writeToFile(separator);
+    lines.push(SEPARATOR);
+    await this.writeLinesToFile(lines);
   }
 
   async info(message) {
@@ -127,45 +363,61 @@ class Logger {
 
   async updateProgress(increment = 1) {
     this.processedItems += increment;
+    // Single clock read shared by the record/throttle/ETA below
+    const nowNs = process.hrtime.bigint();
+
+    // Binary sink replaces the text line entirely, so every call is recorded
+    if (this.progressHandle) {
+      this.writeProgressRecord(nowNs);
+      return;
+    }
+
+    // Emit at most every progressStride items (for totals of 2000+) or
+    // PROGRESS_INTERVAL_MS, always including the final item; the count
+    // itself stays exact
+    const elapsed = this.elapsedMs(nowNs);
+    const finished = this.totalItems > 0 && this.processedItems >= this.totalItems;
+    const onStride = this.progressStride > 1 && this.processedItems % this.progressStride === 0;
+    if (!finished && !onStride && elapsed < this.nextProgressAt) {
+      return;
+    }
+    this.nextProgressAt = elapsed + PROGRESS_INTERVAL_MS;
     
     let progressMessage;
     if (this.totalItems > 0) {
-      const percentage = ((this.processedItems / this.totalItems) * 100).toFixed(1);
-      const elapsed = Date.now() - this.startTime;
-      const avgTimePerItem = elapsed / this.processedItems;
-      const remaining = this.totalItems - this.processedItems;
-      const estimatedTimeLeft = remaining * avgTimePerItem;
+      const percentage = Logger.formatPercentage(this.processedItems, this.totalItems);
+      const remaining = Math.max(this.totalItems - this.processedItems, 0);
+      const estimatedTimeLeft = Math.floor(elapsed * remaining / Math.max(this.processedItems, 1));
       
       progressMessage = `Progress: ${this.processedItems}/${this.totalItems} (${percentage}%) | ETA: ${this.formatDuration(estimatedTimeLeft)}`;
     } else {
       progressMessage = `Processed: ${this.processedItems} items`;
     }
 
-    console.log(`📈 ${progressMessage}`);
+    this.writeToConsole([`📈 ${progressMessage}`]);
     await this.writeToFile(`Progress: ${progressMessage}`);
   }
 
   async batch(batchNumber, totalBatches, itemsInBatch) {
-    const percentage = totalBatches > 0 ? ((batchNumber / totalBatches) * 100).toFixed(1) : '0.0';
+    const percentage = Logger.formatPercentage(batchNumber, totalBatches);
     const batchMessage = `Processing batch ${batchNumber}/${totalBatches} (${percentage}%) - ${itemsInBatch} items`;
     
-    console.log(`📦 ${batchMessage}`);
+    this.writeToConsole([`📦 ${batchMessage}`]);
     await this.writeToFile(`Batch: ${batchMessage}`);
   }
 
   async pause(duration) {
     const pauseMessage = `Pausing for ${duration}ms to respect rate limits...`;
-    console.log(`⏸️  ${pauseMessage}`);
+    this.writeToConsole([`⏸️  ${pauseMessage}`]);
     await this.writeToFile(`Pause: ${pauseMessage}`);
   }
 
   async complete(dataCount = null, filePath = null) {
     const endTime = Date.now();
-    const totalDuration = endTime - this.startTime;
-    const separator = '─'.repeat(60);
+    const totalDuration = this.elapsedMs();
     
     const summary = [
-      separator,
+      SEPARATOR,
       `${this.processName} completed!`,
       `Total duration: ${this.formatDuration(totalDuration)}`,
       `Items processed: ${this.processedItems}`
@@ -183,56 +435,99 @@ class Logger {
       summary.push(`Errors encountered: ${this.errors.length}`);
     }
     
-    summary.push(`End time: ${new Date(endTime).toISOString()}`);
+    summary.push(`End time: ${this.formatTimestamp(endTime)}`);
 
     // Console output with emojis
-    console.log(separator);
-    console.log(`🎉 ${this.processName} completed!`);
-    console.log(`⏱️  Total duration: ${this.formatDuration(totalDuration)}`);
-    console.log(`📊 Items processed: ${this.processedItems}`);
+    const consoleLines = [
+      SEPARATOR,
+      `🎉 ${this.processName} completed!`,
+      `⏱️  Total duration: ${this.formatDuration(totalDuration)}`,
+      `📊 Items processed: ${this.processedItems}`
+    ];
     
     if (dataCount !== null) {
-      console.log(`📈 Data records: ${dataCount}`);
+      consoleLines.push(`📈 Data records: ${dataCount}`);
     }
     
     if (filePath) {
-      console.log(`💾 Data saved to: ${filePath}`);
+      consoleLines.push(`💾 Data saved to: ${filePath}`);
     }
     
     if (this.enableFileLogging && this.logFile) {
-      console.log(`📄 Log file saved to: ${this.logFile}`);
+      consoleLines.push(`📄 Log file saved to: ${this.logFile}`);
+    }
+
+    if (this.progressFile) {
+      consoleLines.push(`📈 Progress records saved to: ${this.progressFile}`);
     }
     
     if (this.errors.length > 0) {
-      console.log(`⚠️  Errors encountered: ${this.errors.length}`);
-      this.errors.forEach((err, idx) => {
-        console.log(`   ${idx + 1}. ${err.message}`);
+      consoleLines.push(`⚠️  Errors encountered: ${this.errors.length}`);
+      this.errors.forEach(([errMessage], idx) => {
+        consoleLines.push(`   ${idx + 1}. ${errMessage}`);
       });
     }
     
-    console.log(`🏁 End time: ${new Date(endTime).toISOString()}\n`);
+    consoleLines.push(`🏁 End time: ${this.formatTimestamp(endTime)}\n`);
+    this.writeToConsole(consoleLines);
 
     // File logging (plain text)
-    for (const line of summary) {
-      await this.writeToFile(line);
-    }
-
     if (this.errors.length > 0) {
-      await this.writeToFile(`\nError Summary:`);
-      this.errors.forEach((err, idx) => {
-        this.writeToFile(`${idx + 1}. ${err.message} (${err.timestamp})`);
+      summary.push(`\nError Summary:`);
+      this.errors.forEach(([errMessage, , errTimestamp], idx) => {
+        summary.push(`${idx + 1}. ${errMessage} (${errTimestamp})`);
       });
     }
 
-    await this.writeToFile(`\n=== ${this.processName} Log Completed ===`);
+    summary.push(`\n=== ${this.processName} Log Completed ===`);
+    await this.writeLinesToFile(summary);
+
+    // The file stays open: importers keep logging between assets after
+    // complete(), and those lines belong in this file. The next start()
+    // closes it, and the exit hook covers anything still queued.
+    this.flushProgressBuffer();
+    await this.flush();
+  }
+
+  formatTimestamp(now = Date.now()) {
+    // Equivalent to new Date(now).toISOString(), but the date/time part is
+    // only rebuilt when the second changes
+    const second = Math.floor(now / 1000);
+    if (second !== this.timestampCache.second) {
+      this.timestampCache = {
+        second,
+        prefix: new Date(second * 1000).toISOString().slice(0, 19)
+      };
+    }
+
+    const ms = now - second * 1000;
+    return `${this.timestampCache.prefix}.${ms < 100 ? (ms < 10 ? '00' : '0') : ''}${ms}Z`;
+  }
+
+  elapsedMs(nowNs = process.hrtime.bigint()) {
+    // Monotonic, so durations and ETAs are unaffected by wall-clock jumps
+    if (this.startNs === null) return 0;
+    return Number((nowNs - this.startNs) / 1000000n);
+  }
+
+  static formatPercentage(done, total) {
+    // One-decimal percentage from integer tenths, rounded half up (exact
+    // ties like 28.75 go up, where toFixed can go either way)
+    if (!(total > 0)) return '0.0';
+    const tenths = Math.floor((done * 2000 + total) / (total * 2));
+    return `${Math.floor(tenths / 10)}.${tenths % 10}`;
   }
 
   formatDuration(ms) {
-    if (ms < 1000) return `${Math.round(ms)}ms`;
-    if (ms < 60000) return `${Math.round(ms / 1000)}s`;
-    if (ms < 3600000) return `${Math.round(ms / 60000)}m ${Math.round((ms % 60000) / 1000)}s`;
-    return `${Math.round(ms / 3600000)}h ${Math.round((ms % 3600000) / 60000)}m`;
+    // Integer ms in, whole units out (truncated, so never "1m 60s")
+    if (ms < 1000) return `${ms}ms`;
+    if (ms < 60000) return `${Math.floor(ms / 1000)}s`;
+    if (ms < 3600000) return `${Math.floor(ms / 60000)}m ${Math.floor((ms % 60000) / 1000)}s`;
+    return `${Math.floor(ms / 3600000)}h ${Math.floor((ms % 3600000) / 60000)}m`;
   }
 }
 
+Logger.PROGRESS_RECORD_TYPE = PROGRESS_RECORD_TYPE;
+Logger.PROGRESS_RECORD_SIZE = PROGRESS_RECORD_SIZE;
+
 module.exports = Logger;
\ No newline at end of file